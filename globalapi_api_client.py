@@ -1,59 +1,324 @@
 """
 API client for CityCatalyst Global API
 Base URL is configurable via the GLOBALAPI_BASE_URL environment variable.
+
+Every endpoint is exposed twice: a blocking function backed by a shared
+httpx.Client, and an ``*_async`` coroutine backed by a shared httpx.AsyncClient
+so concurrent MCP tool calls can overlap their network waits.
 """
+import asyncio
+import atexit
 import os
+import sys
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+from urllib.parse import quote
 
 import httpx
+import orjson
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 BASE_URL = os.getenv("GLOBALAPI_BASE_URL", "https://ccglobal.openearth.dev").rstrip("/")
 
+# Per-request timeout in seconds, also used to bound each call in batched fan-outs.
+REQUEST_TIMEOUT = 10.0
+
+# Connection failures are retried at the transport layer so a transient blip does
+# not fail the whole tool call. HTTP errors (4xx/5xx) are never retried here.
+HTTP_RETRIES = 3
+
+_AR5_PARAMS = httpx.QueryParams({"gwp": "ar5"})
+
+# Emission lookups arriving within this window (seconds) are coalesced, so identical
+# requests from concurrent tool calls hit the API once; at most
+# EMISSIONS_MAX_INFLIGHT distinct lookups run against the API at a time.
+EMISSIONS_BATCH_WINDOW = 0.010
+EMISSIONS_MAX_INFLIGHT = 20
+
+# Shared client so consecutive tool calls reuse keep-alive connections instead of
+# paying a fresh TCP/TLS handshake per request. All endpoints live on one host, so
+# HTTP/2 lets concurrent requests multiplex over a single connection.
+_CLIENT = httpx.Client(
+    base_url=BASE_URL,
+    timeout=REQUEST_TIMEOUT,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=300),
+        retries=HTTP_RETRIES,
+    ),
+)
+atexit.register(_CLIENT.close)
+
+# Async counterpart, created lazily because it must live on the running event loop.
+# The MCP server opens and closes it from its lifespan hook.
+_ASYNC_CLIENT: httpx.AsyncClient | None = None
+
+# The catalogue changes rarely but backs most discovery tools, so keep each format
+# around for a few minutes instead of re-downloading it on every call.
+CATALOGUE_TTL_SECONDS = float(os.getenv("CATALOGUE_TTL", "300"))
+_CAT_CACHE: dict[str, tuple[float, Any]] = {}
+_CAT_STATS = {"hits": 0, "misses": 0}
+# Serialises async cache misses so concurrent tool calls trigger a single download.
+_CAT_LOCK = asyncio.Lock()
+
+# City areas never change, so successful lookups are kept for the process lifetime.
+CITY_AREA_CACHE_SIZE = 4096
+_CITY_AREAS: dict[str, dict] = {}
+
+# Lookup structures derived from the cached JSON catalogue; rebuilt whenever the
+# underlying payload object changes.
+_CAT_INDEX: dict | None = None
+# Per-query results memoised on an index are capped so arbitrary model-generated
+# queries cannot grow memory for the lifetime of the catalogue.
+QUERY_MEMO_SIZE = 512
+# Joins fields in the match blob; a control character keeps source queries from
+# matching across field boundaries (list_datasources() swaps it for a space).
+_BLOB_SEP = "\x00"
+# Datasource fields whose values repeat across many entries; interned on load so
+# duplicates share one string object.
+_INTERNED_FIELDS = ("publisher_id", "spatial_resolution", "geographical_location", "gpc_reference_number")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=REQUEST_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                # Drop idle connections before typical reverse-proxy idle timeouts do.
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=15.0),
+                retries=HTTP_RETRIES,
+            ),
+        )
+    return _ASYNC_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient if it was opened."""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is not None:
+        await _ASYNC_CLIENT.aclose()
+        _ASYNC_CLIENT = None
+
+
+def _json(response: httpx.Response) -> Any:
+    """Parse a JSON body straight from bytes, skipping httpx's decode-to-str step."""
+    return orjson.loads(response.content)
+
 
 def get_health() -> dict:
     """
     Check the health of the CityCatalyst Global API service.
-    
+
     Returns:
         dict: Health status information
     """
-    response = httpx.get(f"{BASE_URL}/health", timeout=10.0)
+    response = _CLIENT.get("/health")
+    response.raise_for_status()
+    return _json(response)
+
+
+async def get_health_async() -> dict:
+    """Async variant of get_health()."""
+    response = await get_http_client().get("/health")
     response.raise_for_status()
-    return response.json()
+    return _json(response)
+
+
+def _city_emission_path(source: str, city: str, year: str, gpc_reference_number: str) -> str:
+    city_encoded = quote(city, safe="")
+    return f"/api/v1/source/{source}/city/{city_encoded}/{year}/{gpc_reference_number}"
+
+
+def _gwp_params(gwp: str) -> httpx.QueryParams:
+    # The default GWP is by far the most common; reuse its pre-encoded query.
+    return _AR5_PARAMS if gwp == "ar5" else httpx.QueryParams({"gwp": gwp})
+
+
+def _extract_co2eq(data: dict) -> str | None:
+    return data.get("totals", {}).get("emissions", {}).get("co2eq_100yr")
 
 
 def _fetch_city_emission(source: str, city: str, year: str, gpc_reference_number: str, gwp: str = "ar5") -> str | None:
     """
     Single-scope helper: fetch total CO2eq (100yr) for a given GPC reference number.
     """
-    import urllib.parse
+    path = _city_emission_path(source, city, year, gpc_reference_number)
+    response = _CLIENT.get(path, params=_gwp_params(gwp))
+    response.raise_for_status()
+    return _extract_co2eq(_json(response))
 
-    city_encoded = urllib.parse.quote(city)
-    path = f"/api/v1/source/{source}/city/{city_encoded}/{year}/{gpc_reference_number}"
-    params = {"gwp": gwp}
 
-    response = httpx.get(f"{BASE_URL}{path}", params=params, timeout=10.0)
+async def _fetch_city_emission_async(
+    source: str, city: str, year: str, gpc_reference_number: str, gwp: str = "ar5"
+) -> str | None:
+    """Async variant of _fetch_city_emission()."""
+    path = _city_emission_path(source, city, year, gpc_reference_number)
+    response = await get_http_client().get(path, params=_gwp_params(gwp))
     response.raise_for_status()
-    data = response.json()
-    return data.get("totals", {}).get("emissions", {}).get("co2eq_100yr")
+    return _extract_co2eq(_json(response))
+
+
+class AsyncBatcher:
+    """
+    Collect concurrent calls for a short window and run them as one batch.
+
+    Callers submit the arguments for fetch(); once the window closes, every distinct
+    argument tuple is fetched once (bounded by max_inflight) and all callers that
+    submitted it receive the same result or exception. timeout bounds each fetch
+    itself, not the time spent waiting for the window or a free slot.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Awaitable[Any]],
+        window: float = EMISSIONS_BATCH_WINDOW,
+        max_inflight: int = EMISSIONS_MAX_INFLIGHT,
+        timeout: float | None = None,
+    ) -> None:
+        self._fetch = fetch
+        self._window = window
+        self._max_inflight = max_inflight
+        self._timeout = timeout
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore = asyncio.Semaphore(max_inflight)
+        self._pending: dict[tuple, asyncio.Future] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    async def submit(self, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # State left by a previous event loop (e.g. an earlier asyncio.run) can never
+            # complete on this one; start over.
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._max_inflight)
+            self._pending = {}
+            self._flush_task = None
+
+        future = self._pending.get(args)
+        if future is None:
+            future = self._pending[args] = loop.create_future()
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush())
+                self._flush_task.add_done_callback(self._flush_done)
+        # Shield the shared future so one caller timing out does not cancel the rest.
+        return await asyncio.shield(future)
+
+    def _take_pending(self) -> dict[tuple, asyncio.Future]:
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        return pending
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        # Cancelled before the window closed (possibly before it even started): the
+        # batch was never taken, so release its callers here.
+        if task.cancelled() and self._flush_task is task:
+            for future in self._take_pending().values():
+                future.cancel()
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(self._window)
+        pending = self._take_pending()
+        await asyncio.gather(*(self._run(args, future) for args, future in pending.items()))
+
+    async def _run(self, args: tuple, future: asyncio.Future) -> None:
+        try:
+            async with self._semaphore:
+                result = await asyncio.wait_for(self._fetch(*args), timeout=self._timeout)
+        except Exception as exc:  # noqa: BLE001
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            # A cancelled flush must not leave callers waiting on the future forever.
+            if not future.done():
+                future.cancel()
+
+
+_EMISSIONS_BATCHER = AsyncBatcher(_fetch_city_emission_async, timeout=REQUEST_TIMEOUT)
 
 
 def get_city_emissions(source: str, city: str, year: str, gpc_reference_number: str, gwp: str = "ar5") -> str | None:
     """
     Get total CO2eq emissions from CityCatalyst Global API for a single GPC scope.
-    
+
     Args:
         source: Data source (e.g., "SEEG")
         city: City identifier (e.g., "BR SER")
         year: Year (e.g., "2022")
         gpc_reference_number: GPC reference number (e.g., "II.1.1")
         gwp: Global Warming Potential standard (default: "ar5")
-    
+
     Returns:
         str | None: Total CO2eq emissions (100yr) value, or None when no data exists.
     """
     return _fetch_city_emission(source, city, year, gpc_reference_number, gwp)
 
 
+async def get_city_emissions_async(
+    source: str, city: str, year: str, gpc_reference_number: str, gwp: str = "ar5"
+) -> str | None:
+    """
+    Async variant of get_city_emissions().
+
+    Goes through the shared AsyncBatcher, so identical lookups issued by concurrent
+    tool calls within EMISSIONS_BATCH_WINDOW share one API request.
+    """
+    return await _EMISSIONS_BATCHER.submit(source, city, year, gpc_reference_number, gwp)
+
+
+def _scope_value_entry(scope: str, value: str | None) -> dict:
+    if value is None:
+        return {
+            "gpc_reference_number": scope,
+            "co2eq_100yr": None,
+            "status": "empty",
+            "message": "No emissions data for this scope.",
+        }
+    return {
+        "gpc_reference_number": scope,
+        "co2eq_100yr": value,
+        "status": "ok",
+    }
+
+
+def _scope_error_entry(scope: str, exc: BaseException) -> dict:
+    if (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response is not None
+        and exc.response.status_code == 404
+    ):
+        return {
+            "gpc_reference_number": scope,
+            "co2eq_100yr": None,
+            "status": "empty",
+            "message": "No emissions data for this scope (404 from API).",
+        }
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError)):
+        # str() of a timeout is empty; say what happened so it is not a blank error.
+        return {
+            "gpc_reference_number": scope,
+            "co2eq_100yr": None,
+            "status": "error",
+            "message": f"Timed out after {REQUEST_TIMEOUT}s",
+        }
+    return {
+        "gpc_reference_number": scope,
+        "co2eq_100yr": None,
+        "status": "error",
+        "message": str(exc),
+    }
+
+
 def get_city_emissions_all_scopes(
     source: str,
     city: str,
@@ -82,87 +347,401 @@ def get_city_emissions_all_scopes(
     for scope in scopes:
         try:
             value = _fetch_city_emission(source, city, year, scope, gwp)
-            if value is None:
-                emissions.append(
-                    {
-                        "gpc_reference_number": scope,
-                        "co2eq_100yr": None,
-                        "status": "empty",
-                        "message": "No emissions data for this scope.",
-                    }
-                )
-            else:
-                emissions.append(
-                    {
-                        "gpc_reference_number": scope,
-                        "co2eq_100yr": value,
-                        "status": "ok",
-                    }
-                )
-        except httpx.HTTPStatusError as exc:  # type: ignore[attr-defined]
-            if exc.response is not None and exc.response.status_code == 404:
-                emissions.append(
-                    {
-                        "gpc_reference_number": scope,
-                        "co2eq_100yr": None,
-                        "status": "empty",
-                        "message": "No emissions data for this scope (404 from API).",
-                    }
-                )
-            else:
-                emissions.append(
-                    {
-                        "gpc_reference_number": scope,
-                        "co2eq_100yr": None,
-                        "status": "error",
-                        "message": str(exc),
-                    }
-                )
+            emissions.append(_scope_value_entry(scope, value))
         except Exception as exc:  # noqa: BLE001
-            emissions.append(
-                {
-                    "gpc_reference_number": scope,
-                    "co2eq_100yr": None,
-                    "status": "error",
-                    "message": str(exc),
-                }
-            )
+            emissions.append(_scope_error_entry(scope, exc))
+
+    return {"gpc_scopes": scopes, "emissions": emissions}
+
+
+async def get_city_emissions_all_scopes_async(
+    source: str,
+    city: str,
+    year: str,
+    gwp: str = "ar5",
+    gpc_scopes: list[str] | None = None,
+) -> dict:
+    """
+    Async variant of get_city_emissions_all_scopes().
+
+    Scopes are fetched concurrently; the result keeps the order of gpc_scopes.
+    """
+    scopes = gpc_scopes or await get_gpc_reference_numbers_by_source_async(source)
+    results = await asyncio.gather(
+        *(get_city_emissions_async(source, city, year, scope, gwp) for scope in scopes),
+        return_exceptions=True,
+    )
+
+    emissions: list[dict] = []
+    for scope, value in zip(scopes, results):
+        if isinstance(value, Exception):
+            emissions.append(_scope_error_entry(scope, value))
+        elif isinstance(value, BaseException):
+            raise value
+        else:
+            emissions.append(_scope_value_entry(scope, value))
 
     return {"gpc_scopes": scopes, "emissions": emissions}
 
 
+async def get_city_emissions_batch_async(
+    source: str,
+    cities: list[str],
+    year: str,
+    gpc_reference_number: str,
+    gwp: str = "ar5",
+) -> dict:
+    """
+    Fetch one GPC scope for many cities concurrently.
+
+    Each city's request is bounded by REQUEST_TIMEOUT (applied by the emissions
+    batcher) and fails independently, so one bad city is reported as an
+    "error"/"empty" entry instead of failing the batch.
+
+    Returns:
+        dict: {
+            "gpc_reference_number": "II.1.1",
+            "emissions": [
+                {"city": "BR SER", "gpc_reference_number": "II.1.1", "co2eq_100yr": 123, "status": "ok"},
+                ...
+            ],
+        }
+    """
+    results = await asyncio.gather(
+        *(
+            get_city_emissions_async(source, city, year, gpc_reference_number, gwp)
+            for city in cities
+        ),
+        return_exceptions=True,
+    )
+
+    emissions: list[dict] = []
+    for city, value in zip(cities, results):
+        if isinstance(value, Exception):
+            entry = _scope_error_entry(gpc_reference_number, value)
+        elif isinstance(value, BaseException):
+            raise value
+        else:
+            entry = _scope_value_entry(gpc_reference_number, value)
+        emissions.append({"city": city, **entry})
+
+    return {"gpc_reference_number": gpc_reference_number, "emissions": emissions}
+
+
+def _bounded_put(cache: dict, key: str, value: Any, limit: int) -> Any:
+    """Store value in cache, first evicting the oldest entry once it holds limit entries."""
+    if len(cache) >= limit:
+        # Dicts keep insertion order, so the first key is the oldest.
+        del cache[next(iter(cache))]
+    cache[key] = value
+    return value
+
+
+def _remember_city_area(locode: str, area: dict) -> dict:
+    return _bounded_put(_CITY_AREAS, locode, area, CITY_AREA_CACHE_SIZE)
+
+
 def get_city_area(locode: str) -> dict:
     """
     Get the area of a city by its locode.
-    
+
+    City boundaries are static, so each locode is fetched at most once per process.
+
     Args:
         locode: Unique identifier for the city
-    
+
     Returns:
         dict: City area in square kilometers
     """
-    response = httpx.get(f"{BASE_URL}/api/v0/cityboundary/city/{locode}/area", timeout=10.0)
+    area = _CITY_AREAS.get(locode)
+    if area is None:
+        response = _CLIENT.get(f"/api/v0/cityboundary/city/{locode}/area")
+        response.raise_for_status()
+        area = _remember_city_area(locode, _json(response))
+    return area
+
+
+async def get_city_area_async(locode: str) -> dict:
+    """Async variant of get_city_area(); shares the same per-locode cache."""
+    area = _CITY_AREAS.get(locode)
+    if area is None:
+        response = await get_http_client().get(f"/api/v0/cityboundary/city/{locode}/area")
+        response.raise_for_status()
+        area = _remember_city_area(locode, _json(response))
+    return area
+
+
+def clear_city_area_cache() -> None:
+    """Forget cached city areas so the next lookup per locode hits the API again."""
+    _CITY_AREAS.clear()
+
+
+def _cached_catalogue(key: str) -> Any | None:
+    cached = _CAT_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < CATALOGUE_TTL_SECONDS:
+        _CAT_STATS["hits"] += 1
+        return cached[1]
+    return None
+
+
+def _get_catalogue_json(params: dict) -> Any:
+    response = _CLIENT.get("/api/v0/catalogue", params=params)
+    response.raise_for_status()
+    return _json(response)
+
+
+def _get_catalogue_csv(params: dict) -> str:
+    response = _CLIENT.get("/api/v0/catalogue", params=params)
+    response.raise_for_status()
+    # Endpoint returns CSV when format=csv; surface the raw text instead of JSON parsing.
+    # Decode directly rather than via response.text to skip charset detection.
+    return response.content.decode("utf-8", "replace")
+
+
+async def _get_catalogue_json_async(params: dict) -> Any:
+    response = await get_http_client().get("/api/v0/catalogue", params=params)
     response.raise_for_status()
-    return response.json()
+    # The catalogue is the largest payload we parse; keep it off the event loop.
+    return await asyncio.to_thread(_json, response)
+
+
+async def _get_catalogue_csv_async(params: dict) -> str:
+    response = await get_http_client().get("/api/v0/catalogue", params=params)
+    response.raise_for_status()
+    return response.content.decode("utf-8", "replace")
+
+
+def _is_csv(format: str | None) -> bool:
+    return bool(format) and str(format).lower() == "csv"
 
 
 def get_catalogue(format: str = None) -> dict:
     """
     Get the data catalogue from CityCatalyst Global API.
-    
+
     Args:
         format: Optional format parameter (e.g., "csv"). When "csv", returns raw text.
-    
+
+    Results are cached per format for CATALOGUE_TTL_SECONDS (env CATALOGUE_TTL).
+
     Returns:
         dict or str: Catalogue data with list of datasources, or CSV text if format="csv"
     """
-    params = {"format": format} if format else {}
-    response = httpx.get(f"{BASE_URL}/api/v0/catalogue", params=params, timeout=10.0)
-    response.raise_for_status()
-    if format and str(format).lower() == "csv":
-        # Endpoint returns CSV when format=csv; surface the raw text instead of JSON parsing.
-        return response.text
-    return response.json()
+    key = format or ""
+    payload = _cached_catalogue(key)
+    if payload is not None:
+        return payload
+
+    _CAT_STATS["misses"] += 1
+    fetch = _get_catalogue_csv if _is_csv(format) else _get_catalogue_json
+    payload = fetch({"format": format} if format else {})
+    _CAT_CACHE[key] = (time.monotonic(), payload)
+    return payload
+
+
+async def get_catalogue_async(format: str = None) -> dict:
+    """Async variant of get_catalogue(); shares the same TTL cache."""
+    key = format or ""
+    payload = _cached_catalogue(key)
+    if payload is not None:
+        return payload
+
+    async with _CAT_LOCK:
+        # Another caller may have refreshed the entry while this one was waiting.
+        payload = _cached_catalogue(key)
+        if payload is not None:
+            return payload
+
+        _CAT_STATS["misses"] += 1
+        fetch = _get_catalogue_csv_async if _is_csv(format) else _get_catalogue_json_async
+        payload = await fetch({"format": format} if format else {})
+        _CAT_CACHE[key] = (time.monotonic(), payload)
+        return payload
+
+
+def iter_catalogue_csv() -> Iterator[str]:
+    """
+    Stream the CSV catalogue row by row without buffering the whole payload.
+
+    Bypasses the catalogue cache; use get_catalogue(format="csv") for the full text.
+
+    Yields:
+        str: One CSV line at a time, without the line terminator.
+    """
+    with _CLIENT.stream("GET", "/api/v0/catalogue", params={"format": "csv"}) as response:
+        response.raise_for_status()
+        yield from response.iter_lines()
+
+
+async def iter_catalogue_csv_async() -> AsyncIterator[bytes]:
+    """
+    Async variant of iter_catalogue_csv() yielding raw byte chunks as they arrive.
+
+    Also bypasses the catalogue cache, so the payload is never held in memory at once.
+    """
+    async with get_http_client().stream(
+        "GET", "/api/v0/catalogue", params={"format": "csv"}
+    ) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            yield chunk
+
+
+def get_catalogue_cache_stats() -> dict:
+    """
+    Report catalogue cache effectiveness.
+
+    Returns:
+        dict: hits, misses, number of cached formats with their age in seconds,
+        the TTL, and how many city areas are cached.
+    """
+    now = time.monotonic()
+    return {
+        "hits": _CAT_STATS["hits"],
+        "misses": _CAT_STATS["misses"],
+        "size": len(_CAT_CACHE),
+        "entries": {key or "json": round(now - ts, 1) for key, (ts, _) in _CAT_CACHE.items()},
+        "ttl_seconds": CATALOGUE_TTL_SECONDS,
+        "city_areas_cached": len(_CITY_AREAS),
+    }
+
+
+def clear_catalogue_cache() -> None:
+    """Drop cached catalogue payloads so the next call re-fetches from the API."""
+    global _CAT_INDEX
+    _CAT_CACHE.clear()
+    _CAT_INDEX = None
+
+
+def _datasources(catalogue: Any) -> list[dict]:
+    return catalogue.get("datasources", []) if isinstance(catalogue, dict) else []
+
+
+def _match_blob(datasource: dict) -> str:
+    """Uppercased haystack of the fields that identify a source, for one-shot matching."""
+    return _BLOB_SEP.join(
+        str(datasource.get(field) or "")
+        for field in ("publisher_id", "datasource_name", "api_endpoint")
+    ).upper()
+
+
+def _match_rows(blobs: list[str], needle: str) -> list[int]:
+    return [i for i, blob in enumerate(blobs) if needle in blob]
+
+
+def _gpc_refs_of(gpc_refs: list, rows: list[int]) -> list[str]:
+    return sorted({gpc_refs[i] for i in rows if gpc_refs[i]})
+
+
+def _datasource_view(datasource: dict) -> dict:
+    """Discovery metadata for one datasource, as returned by list_datasources()."""
+    return {
+        "publisher_id": datasource.get("publisher_id", ""),
+        "datasource_name": datasource.get("datasource_name", ""),
+        "gpc_reference_number": datasource.get("gpc_reference_number"),
+        "start_year": datasource.get("start_year"),
+        "end_year": datasource.get("end_year"),
+        "latest_accounting_year": datasource.get("latest_accounting_year"),
+        "spatial_resolution": datasource.get("spatial_resolution"),
+        "geographical_location": datasource.get("geographical_location"),
+        "api_endpoint": datasource.get("api_endpoint", ""),
+    }
+
+
+def _iso2_codes(codes: list[str]) -> tuple[str, ...]:
+    # Some entries might have mixed or longer strings; keep only ISO2-length codes.
+    return tuple(code for code in codes if len(code) == 2)
+
+
+def _build_catalogue_index(catalogue: Any) -> dict:
+    """
+    Precompute every derived view of the catalogue in a single pass over datasources.
+
+    blobs, views and gpc_refs are columns parallel to datasources: blobs holds one
+    uppercased match string per entry (so source filters are a single substring test),
+    views holds the list_datasources() metadata and gpc_refs the gpc_reference_number.
+    all_codes is the sorted tuple of unique uppercased geographical_location values
+    and iso2_codes its 2-letter subset, so list_available_country_codes() only picks one.
+    Repetitive string fields are interned in place.
+
+    by_source maps every uppercased publisher_id (the values callers pass in practice)
+    to the row numbers whose blob contains it, and by_gpc_source maps it to its sorted
+    GPC reference numbers. Both are fixed once built.
+
+    Any other query is memoised lazily: query_rows holds its matching row numbers and
+    source_years the get_source_years() result. Each keeps at most QUERY_MEMO_SIZE
+    entries, so model-generated filter strings cannot grow memory without bound.
+    """
+    datasources = _datasources(catalogue)
+    blobs: list[str] = []
+    views: list[dict] = []
+    gpc_refs: list[str | None] = []
+    publishers: set[str] = set()
+    codes: set[str] = set()
+    for ds in datasources:
+        for field in _INTERNED_FIELDS:
+            value = ds.get(field)
+            if isinstance(value, str):
+                ds[field] = sys.intern(value)
+        blobs.append(_match_blob(ds))
+        views.append(_datasource_view(ds))
+        gpc_refs.append(ds.get("gpc_reference_number"))
+        publisher = str(ds.get("publisher_id") or "").upper()
+        if publisher:
+            publishers.add(publisher)
+        loc = str(ds.get("geographical_location", "")).strip()
+        if loc:
+            codes.add(loc.upper())
+
+    by_source = {p: _match_rows(blobs, p) for p in publishers}
+    sorted_codes = sorted(codes)
+    return {
+        "catalogue": catalogue,
+        "datasources": datasources,
+        "blobs": blobs,
+        "views": views,
+        "gpc_refs": gpc_refs,
+        "iso2_codes": _iso2_codes(sorted_codes),
+        "all_codes": tuple(sorted_codes),
+        "by_source": by_source,
+        "by_gpc_source": {p: _gpc_refs_of(gpc_refs, rows) for p, rows in by_source.items()},
+        "query_rows": {},
+        "source_years": {},
+    }
+
+
+def _rows_for(index: dict, needle: str) -> list[int]:
+    """Row numbers whose match blob contains the uppercased needle."""
+    rows = index["by_source"].get(needle)
+    if rows is None:
+        rows = index["query_rows"].get(needle)
+    if rows is None:
+        # Index miss: scan once and keep the answer in the bounded query memo.
+        rows = _match_rows(index["blobs"], needle)
+        _bounded_put(index["query_rows"], needle, rows, QUERY_MEMO_SIZE)
+    return rows
+
+
+def _index_for(catalogue: Any) -> dict:
+    global _CAT_INDEX
+    if _CAT_INDEX is None or _CAT_INDEX["catalogue"] is not catalogue:
+        _CAT_INDEX = _build_catalogue_index(catalogue)
+    return _CAT_INDEX
+
+
+def _catalogue_index() -> dict:
+    return _index_for(get_catalogue())
+
+
+async def _catalogue_index_async() -> dict:
+    catalogue = await get_catalogue_async()
+    index = _CAT_INDEX
+    if index is not None and index["catalogue"] is catalogue:
+        return index
+    async with _CAT_LOCK:
+        # Build in a worker thread so other tool calls keep running; the lock stops
+        # concurrent callers from each rebuilding the same index.
+        return await asyncio.to_thread(_index_for, catalogue)
 
 
 def get_cities_by_country(country_code: str) -> dict:
@@ -175,9 +754,20 @@ def get_cities_by_country(country_code: str) -> dict:
     Returns:
         dict: Response from the /api/v0/ccra/city/{country_code} endpoint.
     """
-    response = httpx.get(f"{BASE_URL}/api/v0/ccra/city/{country_code}", timeout=10.0)
+    response = _CLIENT.get(f"/api/v0/ccra/city/{country_code}")
     response.raise_for_status()
-    return response.json()
+    return _json(response)
+
+
+async def get_cities_by_country_async(country_code: str) -> dict:
+    """Async variant of get_cities_by_country()."""
+    response = await get_http_client().get(f"/api/v0/ccra/city/{country_code}")
+    response.raise_for_status()
+    return _json(response)
+
+
+def _country_codes_from_index(index: dict, prefer_iso2: bool) -> list[str]:
+    return list(index["iso2_codes"] if prefer_iso2 else index["all_codes"])
 
 
 def list_available_country_codes(prefer_iso2: bool = True) -> list[str]:
@@ -190,57 +780,124 @@ def list_available_country_codes(prefer_iso2: bool = True) -> list[str]:
     Returns:
         Sorted list of unique country codes present in catalogue datasources.
     """
-    catalogue = get_catalogue()
-    datasources = catalogue.get("datasources", []) if isinstance(catalogue, dict) else []
-    codes = set()
-    for ds in datasources:
-        loc = str(ds.get("geographical_location", "")).strip()
-        if not loc:
-            continue
-        # Some entries might have mixed or longer strings; optionally filter to ISO2 length
-        if prefer_iso2 and len(loc) == 2:
-            codes.add(loc.upper())
-        elif not prefer_iso2:
-            codes.add(loc.upper())
-    return sorted(codes)
+    return _country_codes_from_index(_catalogue_index(), prefer_iso2)
+
+
+async def list_available_country_codes_async(prefer_iso2: bool = True) -> list[str]:
+    """Async variant of list_available_country_codes()."""
+    return _country_codes_from_index(await _catalogue_index_async(), prefer_iso2)
+
+
+def _gpc_refs_from_index(index: dict, source: str) -> list:
+    source_upper = source.upper()
+    refs = index["by_gpc_source"].get(source_upper)
+    if refs is None:
+        # Not a publisher: derive from the (memoised) matching rows.
+        return _gpc_refs_of(index["gpc_refs"], _rows_for(index, source_upper))
+    return list(refs)
 
 
 def get_gpc_reference_numbers_by_source(source: str) -> list:
     """
     Get all GPC reference numbers covered by a particular source.
-    
+
     Args:
         source: Data source name (e.g., "SEEG" or "SEEGv2023")
-    
+
     Returns:
         list: List of unique GPC reference numbers for the specified source, sorted alphabetically
     """
-    catalogue = get_catalogue()
-    
-    # Extract GPC reference numbers for the specified source
-    gpc_refs = set()
-    
-    # The catalogue has a "datasources" list
-    if isinstance(catalogue, dict) and "datasources" in catalogue:
-        for datasource in catalogue["datasources"]:
-            # Match by various possible source identifiers
-            datasource_name = datasource.get("datasource_name", "")
-            publisher_id = datasource.get("publisher_id", "")
-            api_endpoint = datasource.get("api_endpoint", "")
-            
-            # Check if source matches any of these fields (case-insensitive)
-            source_upper = source.upper()
-            if (source_upper in datasource_name.upper() or 
-                source_upper in publisher_id.upper() or 
-                source_upper in api_endpoint.upper() or
-                f"/source/{source}/" in api_endpoint or
-                f"/source/{source_upper}/" in api_endpoint):
-                
-                # Extract gpc_reference_number if present
-                if "gpc_reference_number" in datasource and datasource["gpc_reference_number"]:
-                    gpc_refs.add(datasource["gpc_reference_number"])
-    
-    return sorted(list(gpc_refs))
+    return _gpc_refs_from_index(_catalogue_index(), source)
+
+
+async def get_gpc_reference_numbers_by_source_async(source: str) -> list:
+    """Async variant of get_gpc_reference_numbers_by_source()."""
+    return _gpc_refs_from_index(await _catalogue_index_async(), source)
+
+
+def build_source_automaton(sources: list[str]) -> "ahocorasick.Automaton":
+    """
+    Compile source queries into one Aho-Corasick automaton over uppercased needles.
+
+    Requires the optional pyahocorasick package.
+    """
+    automaton = ahocorasick.Automaton()
+    for source in sources:
+        needle = source.upper()
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+def _gpc_refs_for_sources(index: dict, sources: list[str]) -> dict[str, list]:
+    by_source = index["by_source"]
+    query_rows = index["query_rows"]
+    # Empty needles match everything and cannot be added to an automaton.
+    missing = {
+        s.upper()
+        for s in sources
+        if s and s.upper() not in by_source and s.upper() not in query_rows
+    }
+
+    found: dict[str, list[int]] = {}
+    if missing and ahocorasick is not None:
+        # One pass over the blobs resolves every uncached source at once.
+        found = {needle: [] for needle in missing}
+        automaton = build_source_automaton(list(missing))
+        for i, blob in enumerate(index["blobs"]):
+            for _, needle in automaton.iter(blob):
+                rows = found[needle]
+                # A needle can occur more than once in the same blob.
+                if not rows or rows[-1] != i:
+                    rows.append(i)
+        for needle, rows in found.items():
+            _bounded_put(query_rows, needle, rows, QUERY_MEMO_SIZE)
+
+    refs_by_source: dict[str, list] = {}
+    for source in sources:
+        # Use this call's scan results directly; the memo may already have evicted them.
+        rows = found.get(source.upper())
+        if rows is not None:
+            refs_by_source[source] = _gpc_refs_of(index["gpc_refs"], rows)
+        else:
+            refs_by_source[source] = _gpc_refs_from_index(index, source)
+    return refs_by_source
+
+
+def get_gpc_reference_numbers_by_sources(sources: list[str]) -> dict[str, list]:
+    """
+    Get GPC reference numbers for several sources in one catalogue pass.
+
+    Matching follows get_gpc_reference_numbers_by_source(). Uncached sources are
+    resolved together with an Aho-Corasick automaton when pyahocorasick is installed,
+    otherwise one at a time.
+
+    Args:
+        sources: Data source names (e.g., ["SEEG", "ClimateTRACE"])
+
+    Returns:
+        dict: Maps each requested source to its sorted GPC reference numbers.
+    """
+    return _gpc_refs_for_sources(_catalogue_index(), sources)
+
+
+async def get_gpc_reference_numbers_by_sources_async(sources: list[str]) -> dict[str, list]:
+    """Async variant of get_gpc_reference_numbers_by_sources()."""
+    return _gpc_refs_for_sources(await _catalogue_index_async(), sources)
+
+
+def _datasources_from_index(index: dict, filter_text: str | None) -> list[dict]:
+    if not filter_text:
+        return list(index["views"])
+    views = index["views"]
+    needle = filter_text.upper()
+    if " " in needle or _BLOB_SEP in needle:
+        # list_datasources() matches the space-joined fields, so a filter with a space
+        # may span publisher_id, datasource_name and api_endpoint.
+        rows = [i for i, blob in enumerate(index["blobs"]) if needle in blob.replace(_BLOB_SEP, " ")]
+    else:
+        rows = _rows_for(index, needle)
+    return [views[i] for i in rows]
 
 
 def list_datasources(filter_text: str | None = None) -> list[dict]:
@@ -249,42 +906,47 @@ def list_datasources(filter_text: str | None = None) -> list[dict]:
 
     Args:
         filter_text: Optional case-insensitive filter applied to publisher_id,
-            datasource_name, or api_endpoint.
+            datasource_name and api_endpoint joined by spaces, so it may span them.
 
     Returns:
         list of dicts: Each entry contains publisher_id (source), gpc_reference_number,
         start/end/latest years, spatial_resolution, geographical_location,
         and api_endpoint.
     """
-    catalogue = get_catalogue()
-    datasources = catalogue.get("datasources", []) if isinstance(catalogue, dict) else []
-    results: list[dict] = []
-    needle = filter_text.lower() if filter_text else None
+    return _datasources_from_index(_catalogue_index(), filter_text)
+
+
+async def list_datasources_async(filter_text: str | None = None) -> list[dict]:
+    """Async variant of list_datasources()."""
+    return _datasources_from_index(await _catalogue_index_async(), filter_text)
 
-    for ds in datasources:
-        publisher_id = ds.get("publisher_id", "")
-        datasource_name = ds.get("datasource_name", "")
-        api_endpoint = ds.get("api_endpoint", "")
-        if needle:
-            blob = f"{publisher_id} {datasource_name} {api_endpoint}".lower()
-            if needle not in blob:
-                continue
-
-        results.append(
-            {
-                "publisher_id": publisher_id,
-                "datasource_name": datasource_name,
-                "gpc_reference_number": ds.get("gpc_reference_number"),
-                "start_year": ds.get("start_year"),
-                "end_year": ds.get("end_year"),
-                "latest_accounting_year": ds.get("latest_accounting_year"),
-                "spatial_resolution": ds.get("spatial_resolution"),
-                "geographical_location": ds.get("geographical_location"),
-                "api_endpoint": api_endpoint,
-            }
-        )
 
-    return results
+def _source_years_from_index(index: dict, source: str) -> dict | None:
+    rows = _rows_for(index, source.upper())
+    if not rows:
+        return None
+
+    view = index["views"][rows[0]]
+    return {
+        "publisher_id": str(view["publisher_id"]),
+        "datasource_name": str(view["datasource_name"]),
+        "gpc_reference_number": view["gpc_reference_number"],
+        "start_year": view["start_year"],
+        "end_year": view["end_year"],
+        "latest_accounting_year": view["latest_accounting_year"],
+        "geographical_location": view["geographical_location"],
+    }
+
+
+def _source_years_for(index: dict, source: str) -> dict | None:
+    source_upper = source.upper()
+    memo = index["source_years"]
+    if source_upper in memo:
+        years = memo[source_upper]
+    else:
+        years = _source_years_from_index(index, source_upper)
+        _bounded_put(memo, source_upper, years, QUERY_MEMO_SIZE)
+    return dict(years) if years is not None else None
 
 
 def get_source_years(source: str) -> dict | None:
@@ -298,28 +960,9 @@ def get_source_years(source: str) -> dict | None:
         dict with start_year, end_year, latest_accounting_year, and gpc_reference_number,
         or None if no match is found.
     """
-    catalogue = get_catalogue()
-    datasources = catalogue.get("datasources", []) if isinstance(catalogue, dict) else []
-    source_upper = source.upper()
+    return _source_years_for(_catalogue_index(), source)
 
-    for ds in datasources:
-        publisher_id = str(ds.get("publisher_id", ""))
-        datasource_name = str(ds.get("datasource_name", ""))
-        api_endpoint = str(ds.get("api_endpoint", ""))
-        if (
-            source_upper in publisher_id.upper()
-            or source_upper in datasource_name.upper()
-            or source_upper in api_endpoint.upper()
-        ):
-            return {
-                "publisher_id": publisher_id,
-                "datasource_name": datasource_name,
-                "gpc_reference_number": ds.get("gpc_reference_number"),
-                "start_year": ds.get("start_year"),
-                "end_year": ds.get("end_year"),
-                "latest_accounting_year": ds.get("latest_accounting_year"),
-                "geographical_location": ds.get("geographical_location"),
-            }
-
-    return None
 
+async def get_source_years_async(source: str) -> dict | None:
+    """Async variant of get_source_years()."""
+    return _source_years_for(await _catalogue_index_async(), source)
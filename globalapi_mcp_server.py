@@ -4,33 +4,275 @@ Exposes tools to interact with the CityCatalyst Global API endpoints.
 Transport: STDIO (default - subprocess via stdin/stdout)
 
 Requirements:
-    pip install fastmcp httpx
+    pip install fastmcp "httpx[http2]" orjson
 """
 import argparse
 import asyncio
+import atexit
+import hashlib
+import logging
+import logging.handlers
 import os
+import queue
 import sys
-
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import orjson
 from fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from globalapi_api_client import (
-    get_health,
-    get_city_emissions_all_scopes as get_city_emissions_all_scopes_api,
-    get_city_area,
-    get_catalogue,
-    get_gpc_reference_numbers_by_source as get_gpc_reference_numbers_by_source_api,
-    list_datasources,
-    get_source_years,
-    get_cities_by_country,
-    list_available_country_codes,
+    CATALOGUE_TTL_SECONDS,
+    close_http_client,
+    get_http_client,
+    get_health_async,
+    get_city_emissions_all_scopes_async,
+    get_city_emissions_batch_async,
+    get_city_area_async,
+    get_catalogue_async,
+    get_catalogue_cache_stats,
+    iter_catalogue_csv_async,
+    get_gpc_reference_numbers_by_source_async,
+    get_gpc_reference_numbers_by_sources_async,
+    list_datasources_async,
+    get_source_years_async,
+    get_cities_by_country_async,
+    list_available_country_codes_async,
 )
 
+try:
+    import boto3
+except ImportError:
+    boto3 = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Warm-up runs before the server accepts requests, so an unreachable upstream must
+# not hold startup past the liveness probe.
+WARMUP_TIMEOUT_SECONDS = 5.0
+
+
+async def _prime() -> None:
+    # Any response will do; this only pays the DNS/TCP/TLS setup up front.
+    await get_http_client().get("/")
+    await get_catalogue_async()
+
+
+async def _warm_up() -> None:
+    """Open a pooled connection and prime the catalogue cache before the first tool call."""
+    try:
+        await asyncio.wait_for(_prime(), timeout=WARMUP_TIMEOUT_SECONDS)
+    except (TimeoutError, asyncio.TimeoutError):
+        log.warning("Warm-up timed out after %ss, continuing cold", WARMUP_TIMEOUT_SECONDS)
+    except Exception as e:
+        log.warning("Warm-up failed, continuing cold: %s", e)
+
+
+@asynccontextmanager
+async def lifespan(_: FastMCP) -> AsyncIterator[dict]:
+    """Open the pooled Global API client at startup and close it on shutdown."""
+    client = get_http_client()
+    try:
+        # Opt-in for stdio (editor subprocesses should start instantly); __main__
+        # enables it by default for the long-running HTTP/SSE transports.
+        if os.getenv("WARMUP", "0") == "1":
+            await _warm_up()
+        yield {"http_client": client}
+    finally:
+        await close_http_client()
+
+
+# Reported to clients as server_info.version, which keys their cached tool lists.
+# Every tool is defined in this module, so a digest of its source changes whenever a
+# tool is added, removed, renamed or changes its parameters.
+with open(__file__, "rb") as _source:
+    SERVER_VERSION = hashlib.sha256(_source.read()).hexdigest()[:16]
+
 # Create the MCP server instance
-mcp = FastMCP("CityCatalyst Global API")
+mcp = FastMCP("CityCatalyst Global API", version=SERVER_VERSION, lifespan=lifespan)
 API_BASE_URL = os.getenv("GLOBALAPI_BASE_URL", "https://ccglobal.openearth.dev").rstrip("/")
 SERVICE_NAME = "CityCatalyst Global API MCP"
 
+# Tool tracing is emitted at DEBUG so production runs (default WARNING) skip the
+# formatting work entirely. Set GLOBALAPI_LOG_LEVEL=DEBUG to see every call.
+# Records are handed to a background listener thread so tool handlers never
+# block on stderr writes.
+log = logging.getLogger("globalapi.mcp")
+log.setLevel(os.getenv("GLOBALAPI_LOG_LEVEL", "WARNING").upper())
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter(">>> [MCP SERVER] %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+log.propagate = False
+
+# Large results (the full catalogue) can be parked in S3/MinIO so only a small handle
+# travels through the MCP channel. Disabled unless a bucket is configured; MinIO is
+# reached by setting AWS_ENDPOINT_URL.
+OFFLOAD_BUCKET = os.getenv("MCP_OFFLOAD_S3_BUCKET") or None
+OFFLOAD_THRESHOLD_BYTES = int(os.getenv("MCP_OFFLOAD_THRESHOLD_BYTES", str(32 * 1024)))
+OFFLOAD_PREFIX = "mcp-results/"
+OFFLOAD_PREVIEW_ITEMS = 5
+# Streamed results stay in memory up to this size before spilling to a temp file.
+OFFLOAD_SPOOL_BYTES = 1 << 20
+# Handles for payload objects already offloaded, keyed by id(). Cached catalogue
+# objects are reused across calls, so repeats skip serialising and hashing.
+OFFLOAD_MEMO_SIZE = 4
+_OFFLOADED: OrderedDict[int, tuple[Any, Any]] = OrderedDict()
+# Keys are content-addressed, so one already in the bucket never needs another PUT.
+UPLOADED_KEYS_SIZE = 1024
+_UPLOADED_KEYS: OrderedDict[str, None] = OrderedDict()
+# Last streamed CSV catalogue result, reused for CATALOGUE_TTL_SECONDS like the
+# catalogue cache it bypasses.
+_CSV_OFFLOAD: tuple[float, str | dict] | None = None
+_CSV_OFFLOAD_LOCK = asyncio.Lock()
+_S3_CLIENT = None
+
+
+def _offload_enabled() -> bool:
+    return OFFLOAD_BUCKET is not None and boto3 is not None
+
+
+def _s3_client():
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        _S3_CLIENT = boto3.client("s3")
+    return _S3_CLIENT
+
+
+def _offload_summary(payload: Any) -> tuple[dict, Any]:
+    """Describe a payload and pick a small preview of it for the handle."""
+    if isinstance(payload, str):
+        head = payload.split("\n", OFFLOAD_PREVIEW_ITEMS + 1)[: OFFLOAD_PREVIEW_ITEMS + 1]
+        return {"type": "csv", "rows": max(payload.count("\n"), 1) - 1}, "\n".join(head)
+    if isinstance(payload, dict) and isinstance(payload.get("datasources"), list):
+        datasources = payload["datasources"]
+        return (
+            {"type": "catalogue", "datasources": len(datasources)},
+            datasources[:OFFLOAD_PREVIEW_ITEMS],
+        )
+    if isinstance(payload, list):
+        return {"type": "list", "items": len(payload)}, payload[:OFFLOAD_PREVIEW_ITEMS]
+    return {"type": type(payload).__name__}, None
+
+
+async def _put_once(key: str, body: Any, content_type: str) -> None:
+    """Upload body under key unless this process already has."""
+    if key in _UPLOADED_KEYS:
+        return
+    await asyncio.to_thread(
+        lambda: _s3_client().put_object(
+            Bucket=OFFLOAD_BUCKET, Key=key, Body=body, ContentType=content_type
+        )
+    )
+    _UPLOADED_KEYS[key] = None
+    if len(_UPLOADED_KEYS) > UPLOADED_KEYS_SIZE:
+        _UPLOADED_KEYS.popitem(last=False)
+
+
+def _offload_body(payload: Any) -> tuple[bytes, str]:
+    body = payload.encode("utf-8") if isinstance(payload, str) else orjson.dumps(payload)
+    return body, hashlib.sha256(body).hexdigest()
+
+
+async def _maybe_offload(payload: Any) -> Any:
+    """
+    Return payload inline, or upload it and return a reference handle when its
+    serialized size exceeds MCP_OFFLOAD_THRESHOLD_BYTES.
+    """
+    if not _offload_enabled():
+        return payload
+    memo = _OFFLOADED.get(id(payload))
+    if memo is not None and memo[0] is payload:
+        _OFFLOADED.move_to_end(id(payload))
+        return memo[1]
+
+    # Serialising and hashing a whole catalogue is CPU-bound; keep it off the loop.
+    body, digest = await asyncio.to_thread(_offload_body, payload)
+    if len(body) <= OFFLOAD_THRESHOLD_BYTES:
+        result = payload
+    else:
+        is_csv = isinstance(payload, str)
+        key = f"{OFFLOAD_PREFIX}{digest}.{'csv' if is_csv else 'json'}"
+        try:
+            await _put_once(key, body, "text/csv" if is_csv else "application/json")
+        except Exception as e:
+            # Offloading only saves tokens; fall back to the inline result.
+            log.warning("Offload to s3://%s/%s failed: %s", OFFLOAD_BUCKET, key, e)
+            return payload
+
+        summary, preview = _offload_summary(payload)
+        result = {
+            "ref": f"s3://{OFFLOAD_BUCKET}/{key}",
+            "bytes": len(body),
+            "summary": summary,
+            "preview": preview,
+        }
+
+    # Holding payload pins its id() until the entry is evicted.
+    _OFFLOADED[id(payload)] = (payload, result)
+    if len(_OFFLOADED) > OFFLOAD_MEMO_SIZE:
+        _OFFLOADED.popitem(last=False)
+    return result
+
+
+async def _offload_csv_stream(chunks: AsyncIterator[bytes]) -> str | dict:
+    """
+    Spool a streamed CSV payload and return it inline or as a reference handle,
+    following the same threshold and key scheme as _maybe_offload().
+
+    Only one chunk plus OFFLOAD_SPOOL_BYTES of the payload is held in memory.
+    """
+    digest = hashlib.sha256()
+    size = newlines = 0
+    with tempfile.SpooledTemporaryFile(max_size=OFFLOAD_SPOOL_BYTES) as spool:
+        async for chunk in chunks:
+            digest.update(chunk)
+            spool.write(chunk)
+            size += len(chunk)
+            newlines += chunk.count(b"\n")
+        spool.seek(0)
+        if size <= OFFLOAD_THRESHOLD_BYTES:
+            return spool.read().decode("utf-8", "replace")
+
+        key = f"{OFFLOAD_PREFIX}{digest.hexdigest()}.csv"
+        try:
+            await _put_once(key, spool, "text/csv")
+        except Exception as e:
+            log.warning("Offload to s3://%s/%s failed: %s", OFFLOAD_BUCKET, key, e)
+            spool.seek(0)
+            return spool.read().decode("utf-8", "replace")
+
+        spool.seek(0)
+        head = b"".join(spool.readline() for _ in range(OFFLOAD_PREVIEW_ITEMS + 1))
+    return {
+        "ref": f"s3://{OFFLOAD_BUCKET}/{key}",
+        "bytes": size,
+        "summary": {"type": "csv", "rows": max(newlines, 1) - 1},
+        "preview": head.decode("utf-8", "replace").rstrip("\r\n"),
+    }
+
+
+async def _offload_catalogue_csv() -> str | dict:
+    """Stream the CSV catalogue through _offload_csv_stream() at most once per TTL."""
+    global _CSV_OFFLOAD
+    async with _CSV_OFFLOAD_LOCK:
+        if _CSV_OFFLOAD is None or time.monotonic() - _CSV_OFFLOAD[0] >= CATALOGUE_TTL_SECONDS:
+            result = await _offload_csv_stream(iter_catalogue_csv_async())
+            _CSV_OFFLOAD = (time.monotonic(), result)
+        return _CSV_OFFLOAD[1]
+
 
 @mcp.custom_route("/", methods=["GET"])
 async def root(_: Request) -> JSONResponse:
@@ -46,7 +288,7 @@ async def root(_: Request) -> JSONResponse:
 
 
 @mcp.tool()
-def health_check() -> dict:
+async def health_check() -> dict:
     """
     Check the health of the CityCatalyst Global API service.
     Tests the database connection and returns service status.
@@ -54,19 +296,18 @@ def health_check() -> dict:
     Returns:
         dict: Health status information
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: health_check", file=sys.stderr)
+    log.debug("Tool called: health_check")
     try:
-        result = get_health()
-        print(f"    Result: {result}", file=sys.stderr)
+        result = await get_health_async()
+        log.debug("Result: %s", result)
         return result
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("health_check failed: %s", e)
         raise
 
 
 @mcp.tool()
-def get_city_emissions(
+async def get_city_emissions(
     source: str,
     city: str,
     year: str,
@@ -90,11 +331,10 @@ def get_city_emissions(
     Returns:
         dict: Emissions per GPC scope with status for empty scopes.
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: get_city_emissions", file=sys.stderr)
-    print(f"    Parameters: source={source}, city={city}, year={year}, gpc_reference_number={gpc_reference_number}, gwp={gwp}", file=sys.stderr)
+    log.debug("Tool called: get_city_emissions")
+    log.debug("Parameters: source=%s, city=%s, year=%s, gpc_reference_number=%s, gwp=%s", source, city, year, gpc_reference_number, gwp)
     try:
-        base_scopes = get_gpc_reference_numbers_by_source_api(source=source)
+        base_scopes = await get_gpc_reference_numbers_by_source_async(source=source)
         
         if gpc_reference_number:
             # Keep requested scope first; include the rest to satisfy the "all scopes" requirement.
@@ -105,7 +345,7 @@ def get_city_emissions(
         else:
             scopes = base_scopes
 
-        result = get_city_emissions_all_scopes_api(
+        result = await get_city_emissions_all_scopes_async(
             source=source,
             city=city,
             year=year,
@@ -113,16 +353,59 @@ def get_city_emissions(
             gpc_scopes=scopes,
         )
 
-        empty_scopes = [r["gpc_reference_number"] for r in result.get("emissions", []) if r.get("status") == "empty"]
-        print(f"    Returned {len(result.get('emissions', []))} scopes; empty scopes: {empty_scopes}", file=sys.stderr)
+        if log.isEnabledFor(logging.DEBUG):
+            empty_scopes = [r["gpc_reference_number"] for r in result.get("emissions", []) if r.get("status") == "empty"]
+            log.debug("Returned %d scopes; empty scopes: %s", len(result.get("emissions", [])), empty_scopes)
+        return result
+    except Exception as e:
+        log.warning("get_city_emissions failed: %s", e)
+        raise
+
+
+@mcp.tool()
+async def get_city_emissions_batch(
+    source: str,
+    cities: list[str],
+    year: str,
+    gpc_reference_number: str,
+    gwp: str = "ar5",
+) -> dict:
+    """
+    Get CO2eq emissions (100yr) for one GPC scope across many cities at once.
+    Prefer this over repeated get_city_emissions calls when comparing cities.
+
+    Args:
+        source: Data source (e.g., "SEEG")
+        cities: City identifiers (e.g., ["BR SER", "BR AAX"])
+        year: Year (e.g., "2022")
+        gpc_reference_number: GPC reference number (e.g., "II.1.1")
+        gwp: Global Warming Potential standard (default: "ar5")
+
+    Returns:
+        dict: Emissions per city, with "empty"/"error" status for cities without data.
+    """
+    log.debug("Tool called: get_city_emissions_batch")
+    log.debug(
+        "Parameters: source=%s, cities=%s, year=%s, gpc_reference_number=%s, gwp=%s",
+        source, cities, year, gpc_reference_number, gwp,
+    )
+    try:
+        result = await get_city_emissions_batch_async(
+            source=source,
+            cities=cities,
+            year=year,
+            gpc_reference_number=gpc_reference_number,
+            gwp=gwp,
+        )
+        log.debug("Returned %d cities", len(result["emissions"]))
         return result
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("get_city_emissions_batch failed: %s", e)
         raise
 
 
 @mcp.tool()
-def get_city_area_tool(locode: str) -> dict:
+async def get_city_area_tool(locode: str) -> dict:
     """
     Get the area of a city by its locode.
     Retrieve the area of a city in square kilometers.
@@ -133,20 +416,19 @@ def get_city_area_tool(locode: str) -> dict:
     Returns:
         dict: City area information in square kilometers
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: get_city_area", file=sys.stderr)
-    print(f"    Parameters: locode={locode}", file=sys.stderr)
+    log.debug("Tool called: get_city_area")
+    log.debug("Parameters: locode=%s", locode)
     try:
-        result = get_city_area(locode=locode)
-        print(f"    Result: {result}", file=sys.stderr)
+        result = await get_city_area_async(locode=locode)
+        log.debug("Result: %s", result)
         return result
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("get_city_area failed: %s", e)
         raise
 
 
 @mcp.tool()
-def get_data_catalogue(format: str = None) -> dict:
+async def get_data_catalogue(format: str = None) -> dict | str:
     """
     Get the data catalogue from CityCatalyst Global API.
     Retrieves the list of available datasources.
@@ -155,22 +437,26 @@ def get_data_catalogue(format: str = None) -> dict:
         format: Optional format parameter. Supports "csv" for CSV format.
     
     Returns:
-        dict: Catalogue data with list of datasources
+        dict | str: Catalogue data with list of datasources (CSV text for "csv"), or a
+        "ref" handle with a summary and preview when the catalogue is large (see fetch_ref).
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: get_data_catalogue", file=sys.stderr)
-    print(f"    Parameters: format={format}", file=sys.stderr)
+    log.debug("Tool called: get_data_catalogue")
+    log.debug("Parameters: format=%s", format)
     try:
-        result = get_catalogue(format=format)
-        print(f"    Result: Retrieved catalogue data", file=sys.stderr)
+        if _offload_enabled() and format and format.lower() == "csv":
+            # Stream straight into the offload spool instead of buffering the CSV.
+            result = await _offload_catalogue_csv()
+        else:
+            result = await _maybe_offload(await get_catalogue_async(format=format))
+        log.debug("Result: Retrieved catalogue data")
         return result
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("get_data_catalogue failed: %s", e)
         raise
 
 
 @mcp.tool()
-def get_gpc_refs_by_source(source: str) -> list:
+async def get_gpc_refs_by_source(source: str) -> list:
     """
     List all GPC reference numbers (GPC scopes) covered by a particular source.
     Filters the catalogue data to find all GPC reference numbers for the specified source.
@@ -181,20 +467,42 @@ def get_gpc_refs_by_source(source: str) -> list:
     Returns:
         list: Unique GPC scopes for the specified source, sorted alphabetically.
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: get_gpc_refs_by_source", file=sys.stderr)
-    print(f"    Parameters: source={source}", file=sys.stderr)
+    log.debug("Tool called: get_gpc_refs_by_source")
+    log.debug("Parameters: source=%s", source)
+    try:
+        result = await get_gpc_reference_numbers_by_source_async(source=source)
+        log.debug("Result: Found %d GPC reference numbers", len(result))
+        return result
+    except Exception as e:
+        log.warning("get_gpc_refs_by_source failed: %s", e)
+        raise
+
+
+@mcp.tool()
+async def get_gpc_refs_by_sources(sources: list[str]) -> dict:
+    """
+    List GPC reference numbers for several sources at once.
+    Prefer this over repeated get_gpc_refs_by_source calls when comparing sources.
+
+    Args:
+        sources: Data source names (e.g., ["SEEG", "ClimateTRACE"])
+
+    Returns:
+        dict: Maps each source to its unique GPC scopes, sorted alphabetically.
+    """
+    log.debug("Tool called: get_gpc_refs_by_sources")
+    log.debug("Parameters: sources=%s", sources)
     try:
-        result = get_gpc_reference_numbers_by_source_api(source=source)
-        print(f"    Result: Found {len(result)} GPC reference numbers", file=sys.stderr)
+        result = await get_gpc_reference_numbers_by_sources_async(sources=sources)
+        log.debug("Result: Resolved %d sources", len(result))
         return result
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("get_gpc_refs_by_sources failed: %s", e)
         raise
 
 
 @mcp.tool()
-def list_datasource_meta(filter_text: str = None) -> list:
+async def list_datasource_meta(filter_text: str = None) -> list | dict:
     """
     List datasource metadata from the catalogue.
     Use this to discover valid sources, their coverage years, and GPC numbers.
@@ -203,22 +511,22 @@ def list_datasource_meta(filter_text: str = None) -> list:
         filter_text: Optional substring to filter by source name or endpoint.
 
     Returns:
-        list: Catalogue entries with publisher_id, gpc reference, year range, and endpoints.
+        list: Catalogue entries with publisher_id, gpc reference, year range, and endpoints,
+        or a "ref" handle with a summary and preview when the list is large (see fetch_ref).
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: list_datasource_meta", file=sys.stderr)
-    print(f"    Parameters: filter_text={filter_text}", file=sys.stderr)
+    log.debug("Tool called: list_datasource_meta")
+    log.debug("Parameters: filter_text=%s", filter_text)
     try:
-        result = list_datasources(filter_text=filter_text)
-        print(f"    Result count: {len(result)}", file=sys.stderr)
-        return result
+        result = await list_datasources_async(filter_text=filter_text)
+        log.debug("Result count: %d", len(result))
+        return await _maybe_offload(result)
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("list_datasource_meta failed: %s", e)
         raise
 
 
 @mcp.tool()
-def get_source_coverage(source: str) -> dict:
+async def get_source_coverage(source: str) -> dict:
     """
     Get year coverage and GPC reference number for a datasource.
     
@@ -228,20 +536,19 @@ def get_source_coverage(source: str) -> dict:
     Returns:
         dict: Coverage info including start_year, end_year, latest_accounting_year, gpc_reference_number.
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: get_source_coverage", file=sys.stderr)
-    print(f"    Parameters: source={source}", file=sys.stderr)
+    log.debug("Tool called: get_source_coverage")
+    log.debug("Parameters: source=%s", source)
     try:
-        result = get_source_years(source=source)
-        print(f"    Result: {result}", file=sys.stderr)
+        result = await get_source_years_async(source=source)
+        log.debug("Result: %s", result)
         return result or {}
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("get_source_coverage failed: %s", e)
         raise
 
 
 @mcp.tool()
-def list_cities_by_country(country_code: str) -> dict:
+async def list_cities_by_country(country_code: str) -> dict:
     """
     List locodes/cities for a given country using the CCRA cities endpoint.
 
@@ -251,24 +558,24 @@ def list_cities_by_country(country_code: str) -> dict:
     Returns:
         dict: City list with locodes and names for the country.
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: list_cities_by_country", file=sys.stderr)
-    print(f"    Parameters: country_code={country_code}", file=sys.stderr)
+    log.debug("Tool called: list_cities_by_country")
+    log.debug("Parameters: country_code=%s", country_code)
     try:
-        result = get_cities_by_country(country_code=country_code)
-        if isinstance(result, dict):
-            count = len(result.get("cities", [])) if "cities" in result else len(result)
-        else:
-            count = None
-        print(f"    Result count: {count}", file=sys.stderr)
+        result = await get_cities_by_country_async(country_code=country_code)
+        if log.isEnabledFor(logging.DEBUG):
+            if isinstance(result, dict):
+                count = len(result.get("cities", [])) if "cities" in result else len(result)
+            else:
+                count = None
+            log.debug("Result count: %s", count)
         return result
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("list_cities_by_country failed: %s", e)
         raise
 
 
 @mcp.tool()
-def list_country_codes(prefer_iso2: bool = True) -> list:
+async def list_country_codes(prefer_iso2: bool = True) -> list:
     """
     List available country codes present in the catalogue.
 
@@ -278,16 +585,62 @@ def list_country_codes(prefer_iso2: bool = True) -> list:
     Returns:
         list: Sorted unique country codes derived from catalogue datasources.
     """
-    import sys
-    print(f"\n>>> [MCP SERVER] Tool called: list_country_codes", file=sys.stderr)
-    print(f"    Parameters: prefer_iso2={prefer_iso2}", file=sys.stderr)
+    log.debug("Tool called: list_country_codes")
+    log.debug("Parameters: prefer_iso2=%s", prefer_iso2)
     try:
-        result = list_available_country_codes(prefer_iso2=prefer_iso2)
-        print(f"    Result count: {len(result)}", file=sys.stderr)
+        result = await list_available_country_codes_async(prefer_iso2=prefer_iso2)
+        log.debug("Result count: %d", len(result))
         return result
     except Exception as e:
-        print(f"    Error: {e}", file=sys.stderr)
+        log.warning("list_country_codes failed: %s", e)
+        raise
+
+
+@mcp.tool()
+async def fetch_ref(ref: str) -> dict | list | str:
+    """
+    Fetch the full result behind a "ref" handle returned by another tool.
+    Only call this when the handle's summary and preview are not enough to answer.
+
+    Args:
+        ref: Handle such as "s3://bucket/mcp-results/<hash>.json".
+
+    Returns:
+        dict | list | str: The original tool result (JSON data or CSV text).
+    """
+    log.debug("Tool called: fetch_ref")
+    log.debug("Parameters: ref=%s", ref)
+    if not _offload_enabled():
+        raise ValueError("Result offloading is not configured on this server.")
+    prefix = f"s3://{OFFLOAD_BUCKET}/{OFFLOAD_PREFIX}"
+    if not ref.startswith(prefix):
+        raise ValueError(f"Unknown ref {ref!r}; expected a handle starting with {prefix}")
+    key = ref[len(f"s3://{OFFLOAD_BUCKET}/"):]
+    try:
+        body = await asyncio.to_thread(
+            lambda: _s3_client().get_object(Bucket=OFFLOAD_BUCKET, Key=key)["Body"].read()
+        )
+    except Exception as e:
+        log.warning("fetch_ref failed: %s", e)
         raise
+    log.debug("Result: %d bytes", len(body))
+    if key.endswith(".csv"):
+        return body.decode("utf-8", "replace")
+    return orjson.loads(body)
+
+
+@mcp.tool()
+async def get_cache_stats() -> dict:
+    """
+    Report how well the server-side catalogue cache is working.
+
+    Returns:
+        dict: Cache hits, misses, cached formats with their age, TTL, and cached city areas.
+    """
+    log.debug("Tool called: get_cache_stats")
+    result = get_catalogue_cache_stats()
+    log.debug("Result: %s", result)
+    return result
 
 
 def parse_args() -> argparse.Namespace:
@@ -332,6 +685,8 @@ if __name__ == "__main__":
     port = args.port
     path = args.path
     show_banner = not args.no_banner
+    if transport != "stdio":
+        os.environ.setdefault("WARMUP", "1")
 
     banner_prefix = "=" * 60
     print(banner_prefix, file=sys.stderr)
@@ -342,13 +697,17 @@ if __name__ == "__main__":
         [
             "health_check",
             "get_city_emissions",
+            "get_city_emissions_batch",
             "get_city_area_tool",
             "get_data_catalogue",
             "get_gpc_refs_by_source",
+            "get_gpc_refs_by_sources",
             "list_datasource_meta",
             "get_source_coverage",
             "list_cities_by_country",
             "list_country_codes",
+            "fetch_ref",
+            "get_cache_stats",
         ]
     )
 
@@ -372,7 +731,9 @@ if __name__ == "__main__":
         print(f"API Base URL: {API_BASE_URL}", file=sys.stderr)
         print("Waiting for client requests...", file=sys.stderr)
         print(banner_prefix, file=sys.stderr)
-        asyncio.run(
+        # uvloop (Linux/macOS) lowers per-request overhead for the HTTP transports.
+        run = uvloop.run if uvloop is not None else asyncio.run
+        run(
             mcp.run_http_async(
                 transport=transport,
                 host=host,
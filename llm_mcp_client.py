@@ -3,24 +3,89 @@ Interactive LLM client that pulls tool definitions from the MCP server and
 lets you test them via the OpenAI chat completions API.
 """
 import asyncio
-import json
+import functools
+import hashlib
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, List, Union
 
 from fastmcp import Client
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAioHttpClient
+import msgspec
+import orjson
 import yaml
 
+try:
+    # libyaml-backed loader, several times faster than the pure-Python one.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 try:
     from dotenv import load_dotenv
 except ImportError:
     load_dotenv = None
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 CONFIG_PATH = Path("config.yml")
+TOOL_CACHE_PATH = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcp_client" / "tools.json"
+)
 DEFAULT_MODEL = "gpt-5.1"
 EXIT_WORDS = {"exit", "quit", "q"}
 
+# Caps MCP tool calls in flight at once so a burst of parallel tool calls from the
+# LLM cannot overload the MCP server or the upstream API.
+MCP_MAX_INFLIGHT = int(os.getenv("MCP_MAX_INFLIGHT", "16"))
+_INFLIGHT = asyncio.Semaphore(MCP_MAX_INFLIGHT)
+
+# Compiled argument validators per tool name, filled in by load_openai_tools().
+_VALIDATORS: Dict[str, Callable[[Any], Any]] = {}
+# Scalar types the server's pydantic validation coerces (e.g. "true" -> True), so
+# the local pre-check must not reject them.
+_COERCIBLE_TYPES = {"boolean", "integer", "number"}
+
+# Tool results longer than this are replaced by a <ref:...> placeholder once the
+# turn that used them is over, so they are not resent with every later request.
+TOOL_RESULT_COMPACT_CHARS = 2048
+# Full text of compacted tool results, keyed by the id in their placeholder. Only the
+# most recently stored or recalled TOOL_RESULT_STORE_SIZE results are kept.
+TOOL_RESULT_STORE_SIZE = 32
+_TOOL_RESULTS: "OrderedDict[str, str]" = OrderedDict()
+
+# Client-local tool that lets the model bring a compacted result back.
+RECALL_TOOL_NAME = "recall_tool_result"
+RECALL_TOOL: Dict[str, Any] = {
+    "type": "function",
+    "function": {
+        "name": RECALL_TOOL_NAME,
+        "description": (
+            "Return the full text of an earlier tool result that was shortened "
+            "to a <ref:...> placeholder."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "ref": {
+                    "type": "string",
+                    "description": "The id inside the placeholder, e.g. \"3f2a9c1b7d4e\".",
+                }
+            },
+            "required": ["ref"],
+        },
+    },
+}
+
 
 def load_api_key() -> str:
     """Load OPENAI_API_KEY from .env or the current environment."""
@@ -50,12 +115,17 @@ def _fallback_load_env_file() -> None:
         os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
 
 
+@functools.cache
 def load_config() -> Dict[str, Any]:
-    """Load configuration from config.yml (or return an empty dict if missing)."""
+    """
+    Load configuration from config.yml (or return an empty dict if missing).
+
+    The file is parsed once per process; treat the returned dict as read-only.
+    """
     if not CONFIG_PATH.exists():
         return {}
     try:
-        data = yaml.safe_load(CONFIG_PATH.read_text()) or {}
+        data = yaml.load(CONFIG_PATH.read_text(), Loader=_YamlLoader) or {}
         if not isinstance(data, dict):
             return {}
         return data
@@ -73,7 +143,12 @@ def resolve_mcp_transport(config: Dict[str, Any]) -> Union[str, Path]:
     if isinstance(url, str) and url.strip():
         return url.strip()
 
-    path_value = config.get("mcp_server_path") or "globalapi_mcp_server.py"
+    return _resolve_server_path(config.get("mcp_server_path") or "globalapi_mcp_server.py")
+
+
+@functools.cache
+def _resolve_server_path(path_value: str) -> Path:
+    # Only successful resolutions are cached; a missing file raises every time.
     mcp_path = Path(path_value).expanduser().resolve()
     if not mcp_path.exists():
         raise FileNotFoundError(
@@ -83,32 +158,166 @@ def resolve_mcp_transport(config: Dict[str, Any]) -> Union[str, Path]:
     return mcp_path
 
 
+class FunctionSpec(msgspec.Struct):
+    """The "function" part of an OpenAI tool definition."""
+
+    name: str
+    description: str
+    parameters: Dict[str, Any]
+
+
+class OpenAITool(msgspec.Struct, kw_only=True):
+    """One entry of the OpenAI chat completions "tools" list."""
+
+    type: str = "function"
+    function: FunctionSpec
+
+
 async def build_openai_tools(mcp_client: Client) -> List[Dict[str, Any]]:
     """Fetch tool metadata from the MCP server and adapt it for OpenAI."""
     tools = await mcp_client.list_tools()
-    openai_tools: List[Dict[str, Any]] = []
-    print("\nFetched tools from MCP server:")
-    for tool in tools:
-        schema = tool.inputSchema or {"type": "object", "properties": {}}
-        openai_tools.append(
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description or "",
-                    "parameters": schema,
-                },
-            }
+    openai_tools = [
+        OpenAITool(
+            function=FunctionSpec(
+                name=tool.name,
+                description=tool.description or "",
+                parameters=tool.inputSchema or {"type": "object", "properties": {}},
+            )
         )
+        for tool in tools
+    ]
+    # to_builtins emits the plain dicts the OpenAI client and the tool cache expect.
+    return msgspec.to_builtins(openai_tools)
+
 
+def _print_tools(openai_tools: List[Dict[str, Any]]) -> None:
+    for tool in openai_tools:
+        function = tool["function"]
+        schema = function["parameters"]
         required = ", ".join(schema.get("required", [])) if isinstance(schema, dict) else ""
-        print(f"- {tool.name} (requires: {required or 'none'})")
+        print(f"- {function['name']} (requires: {required or 'none'})")
+
+
+def _tool_cache_etag(config: Dict[str, Any], mcp_client: Client) -> str:
+    """
+    Fingerprint the client config, the server's reported name and version and, for
+    a local stdio server, its module mtime.
+
+    A remote (URL) server is identified only by what it reports: a local file's
+    mtime says nothing about what is deployed there.
+    """
+    digest = hashlib.sha256()
+    transport = resolve_mcp_transport(config)
+    if isinstance(transport, Path):
+        try:
+            # A stat is enough to notice edits without reading the module.
+            digest.update(transport.stat().st_mtime_ns.to_bytes(8, "big"))
+        except OSError:
+            pass
+    digest.update(yaml.safe_dump(config, sort_keys=True).encode())
+    server_info = mcp_client.server_info
+    if server_info is not None:
+        digest.update(f"{server_info.name}\x00{server_info.version}".encode())
+    return digest.hexdigest()
+
+
+def _read_tool_cache(etag: str) -> List[Dict[str, Any]] | None:
+    try:
+        cached = orjson.loads(TOOL_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("etag") != etag:
+        return None
+    tools = cached.get("tools")
+    return tools if isinstance(tools, list) else None
+
+
+def _write_tool_cache(etag: str, openai_tools: List[Dict[str, Any]]) -> None:
+    # Per-process temp name so concurrent clients never interleave writes.
+    tmp_path = TOOL_CACHE_PATH.with_name(f"{TOOL_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        TOOL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(orjson.dumps({"etag": etag, "tools": openai_tools}))
+        os.replace(tmp_path, TOOL_CACHE_PATH)
+    except OSError:
+        # The cache is only an optimisation; never fail startup over it.
+        pass
+
+
+def _lax_schema(node: Any) -> Any:
+    """Copy a JSON schema without the type checks for _COERCIBLE_TYPES."""
+    if isinstance(node, list):
+        return [_lax_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    lax = {key: _lax_schema(value) for key, value in node.items()}
+    types = lax.get("type")
+    if isinstance(types, str):
+        types = [types]
+    if isinstance(types, list) and _COERCIBLE_TYPES.intersection(types):
+        del lax["type"]
+    return lax
+
+
+def compile_validators(openai_tools: List[Dict[str, Any]]) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Compile each tool's parameter schema into a fastjsonschema validator.
+
+    Validators are never stricter than the server: boolean and numeric type checks
+    are dropped because pydantic coerces strings such as "true" or "5" for them,
+    so only structural errors (missing or misspelled arguments, wrong containers)
+    are rejected locally.
+
+    Returns an empty dict when fastjsonschema is not installed; tools whose schema
+    cannot be compiled are skipped and left to the server's own validation.
+    """
+    if fastjsonschema is None:
+        return {}
+    validators: Dict[str, Callable[[Any], Any]] = {}
+    for tool in openai_tools:
+        function = tool["function"]
+        try:
+            # use_default=False: validate only, never inject schema defaults into the
+            # arguments that are forwarded to the server.
+            validators[function["name"]] = fastjsonschema.compile(
+                _lax_schema(function["parameters"]), use_default=False
+            )
+        except Exception:
+            # Any schema fastjsonschema cannot handle just loses the local pre-check.
+            continue
+    return validators
+
+
+async def load_openai_tools(mcp_client: Client, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Return OpenAI tool definitions, reusing the on-disk cache when it is still valid.
+
+    The cache lives in ~/.cache/mcp_client/tools.json (or $XDG_CACHE_HOME) and is
+    tagged with the server module mtime, the config and the server's reported
+    version, so changing any of them triggers a fresh list_tools() discovery.
+    """
+    etag = _tool_cache_etag(config, mcp_client)
+    openai_tools = _read_tool_cache(etag)
+    if openai_tools is not None:
+        print(f"\nLoaded tools from cache ({TOOL_CACHE_PATH}):")
+    else:
+        openai_tools = await build_openai_tools(mcp_client)
+        _write_tool_cache(etag, openai_tools)
+        print("\nFetched tools from MCP server:")
+    _print_tools(openai_tools)
+    _VALIDATORS.clear()
+    _VALIDATORS.update(compile_validators(openai_tools))
     return openai_tools
 
 
 async def call_mcp_tool(mcp_client: Client, name: str, arguments: Dict[str, Any]) -> str:
     """Call a tool on the MCP server and return a JSON string for the chat history."""
-    result = await mcp_client.call_tool(name=name, arguments=arguments or {})
+    validate = _VALIDATORS.get(name)
+    if validate is not None:
+        # Reject malformed LLM arguments locally instead of paying an MCP round-trip.
+        validate(arguments or {})
+    async with _INFLIGHT:
+        result = await mcp_client.call_tool(name=name, arguments=arguments or {})
 
     if result.data is not None:
         payload: Any = result.data
@@ -119,11 +328,83 @@ async def call_mcp_tool(mcp_client: Client, name: str, arguments: Dict[str, Any]
     else:
         payload = "Tool returned no content."
 
-    return json.dumps(payload, ensure_ascii=False, default=str)
+    # orjson emits UTF-8 directly (no ASCII escaping) and handles large catalogue
+    # payloads far faster than the stdlib encoder.
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+
+async def recall_tool_result(arguments: Dict[str, Any]) -> str:
+    """Resolve a recall_tool_result call from the local store of compacted results."""
+    ref = str(arguments.get("ref", "")).removeprefix("<ref:").removesuffix(">")
+    content = _TOOL_RESULTS.get(ref)
+    if content is None:
+        return f"Unknown ref {ref!r}; it may have expired. Call the original tool again."
+    _TOOL_RESULTS.move_to_end(ref)
+    return content
+
+
+def compact_tool_messages(messages: List[Dict[str, Any]]) -> None:
+    """
+    Replace large tool results in the history with short <ref:...> placeholders.
+
+    Run after a turn completes: the model has already answered from those results,
+    and keeping them verbatim would resend them with every later request. The full
+    text stays available through the recall_tool_result tool.
+    """
+    for message in messages:
+        if message.get("role") != "tool":
+            continue
+        content = message.get("content")
+        if not isinstance(content, str) or len(content) <= TOOL_RESULT_COMPACT_CHARS:
+            continue
+        ref = hashlib.sha256(content.encode()).hexdigest()[:12]
+        _TOOL_RESULTS[ref] = content
+        _TOOL_RESULTS.move_to_end(ref)
+        if len(_TOOL_RESULTS) > TOOL_RESULT_STORE_SIZE:
+            # Evict the least recently used result.
+            _TOOL_RESULTS.popitem(last=False)
+        message["content"] = (
+            f"<ref:{ref}> ({len(content)} chars omitted; call {RECALL_TOOL_NAME} to view)"
+        )
+
+
+async def dispatch_tool_calls(mcp_client: Client, tool_calls: List[Any]) -> List[str]:
+    """
+    Run every tool call from one assistant message concurrently.
+
+    Tool calls in a single reply are independent, so the batch finishes in the time
+    of the slowest call. Responses are returned in the original order so each one
+    lines up with its tool_call_id.
+    """
+    calls = []
+    for tc in tool_calls:
+        try:
+            args = orjson.loads(tc.function.arguments or "{}")
+        except orjson.JSONDecodeError:
+            args = {}
+        print(f"\n> Calling tool '{tc.function.name}' with {args}")
+        if tc.function.name == RECALL_TOOL_NAME:
+            calls.append(recall_tool_result(args))
+        else:
+            calls.append(call_mcp_tool(mcp_client, tc.function.name, args))
+
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    tool_responses: List[str] = []
+    for tc, result in zip(tool_calls, results):
+        if isinstance(result, Exception):
+            tool_response = f"Error calling tool {tc.function.name}: {result}"
+            print(tool_response)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            tool_response = result
+        tool_responses.append(tool_response)
+    return tool_responses
 
 
 async def run_conversation_turn(
-    llm: OpenAI,
+    llm: AsyncOpenAI,
     mcp_client: Client,
     messages: List[Dict[str, Any]],
     tools: List[Dict[str, Any]],
@@ -131,7 +412,7 @@ async def run_conversation_turn(
 ) -> None:
     """Send the conversation to the LLM, handle tool calls, and print the reply."""
     while True:
-        completion = llm.chat.completions.create(
+        completion = await llm.chat.completions.create(
             model=model_name,
             messages=messages,
             tools=tools,
@@ -160,20 +441,8 @@ async def run_conversation_turn(
                 }
             )
 
-            for tc in tool_calls:
-                try:
-                    args = json.loads(tc.function.arguments or "{}")
-                except json.JSONDecodeError:
-                    args = {}
-                print(f"\n> Calling tool '{tc.function.name}' with {args}")
-                try:
-                    tool_response = await call_mcp_tool(
-                        mcp_client, tc.function.name, args
-                    )
-                except Exception as exc:  # pylint: disable=broad-except
-                    tool_response = f"Error calling tool {tc.function.name}: {exc}"
-                    print(tool_response)
-
+            tool_responses = await dispatch_tool_calls(mcp_client, tool_calls)
+            for tc, tool_response in zip(tool_calls, tool_responses):
                 messages.append(
                     {
                         "role": "tool",
@@ -194,13 +463,15 @@ async def main() -> None:
     model_name = config.get("openai_model") or DEFAULT_MODEL
     mcp_transport = resolve_mcp_transport(config)
 
-    llm = OpenAI(api_key=api_key)
-
     print("Starting MCP client...")
     print(f"Using OpenAI model: {model_name}")
     print(f"MCP target: {mcp_transport}")
-    async with Client(mcp_transport) as mcp_client:
-        openai_tools = await build_openai_tools(mcp_client)
+    # aiohttp transport keeps LLM requests off the default httpx pool and
+    # lets them run without blocking the event loop.
+    async with AsyncOpenAI(
+        api_key=api_key, http_client=DefaultAioHttpClient()
+    ) as llm, Client(mcp_transport) as mcp_client:
+        openai_tools = await load_openai_tools(mcp_client, config) + [RECALL_TOOL]
 
         print("\nAsk a question to test the tools. Type 'exit' to quit.")
         messages: List[Dict[str, Any]] = []
@@ -215,7 +486,9 @@ async def main() -> None:
             await run_conversation_turn(
                 llm, mcp_client, messages, openai_tools, model_name
             )
+            compact_tool_messages(messages)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop (Linux/macOS) speeds up the many small LLM/MCP round-trips when installed.
+    (uvloop.run if uvloop is not None else asyncio.run)(main())